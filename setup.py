@@ -65,6 +65,8 @@ setup(
         # SQLAlchemy and database support
         "alembic",
         "colanderalchemy",
+        # Fast JSON/JSONB column serialization, stdlib json fallback on py35
+        'orjson; python_version >= "3.6"',
         "psycopg2",
         "pyramid_retry",
         "pyramid_tm",
@@ -1,6 +1,8 @@
 """SQLAlchemy integration for Colander and Deform frameworks."""
 # Standard Library
 import typing as t
+from functools import lru_cache
+from operator import attrgetter
 
 # Pyramid
 import colander
@@ -16,6 +18,11 @@ from websauna.utils.slug import slug_to_uuid
 from websauna.utils.slug import uuid_to_slug
 
 
+# The same UUID slugs reappear across form submissions, so the base64 decode is
+# worth caching. UUID objects are immutable, making them safe to share.
+_slug_to_uuid_cached = lru_cache(maxsize=4096)(slug_to_uuid)
+
+
 def extract_uuid_to_slug(item):
     """Reads uuid attribute on the model name returns it as B64 encoded slug."""
     return uuid_to_slug(item.uuid)
@@ -30,8 +37,9 @@ def convert_query_to_tuples(query: Query, first_column: t.Union[str, t.Callable]
     """
     result = []
 
-    first_column_getter = (lambda item: getattr(item, first_column)) if type(first_column) == str else first_column
-    second_column_getter = (lambda item: getattr(item, second_column)) if type(second_column) == str else second_column
+    # attrgetter resolves the attribute in C, avoiding a Python frame per row
+    first_column_getter = attrgetter(first_column) if isinstance(first_column, str) else first_column
+    second_column_getter = attrgetter(second_column) if isinstance(second_column, str) else second_column
 
     if default_choice:
         result.append(('', default_choice))
@@ -145,6 +153,9 @@ class ModelSet(ModelSchemaType, colander.Set):
         return values
 
     def deserialize_set_to_models(self, node, cstruct):
+        if not cstruct:
+            # Nothing selected - skip session/model resolution and value preprocessing
+            return ModelSetResultList()
         dbsession = self.get_dbsession(node)
         model = self.get_model(node)
         match_column = self.get_match_column(node, model)
@@ -160,7 +171,8 @@ class ModelSet(ModelSchemaType, colander.Set):
         """Convert items to appstruct ids.
         """
         if self.label_column:
-            return [getattr(i, self.label_column) for i in appstruct]
+            # C-level iteration, no Python frame per item
+            return list(map(attrgetter(self.label_column), appstruct))
         else:
             return [str(i) for i in appstruct]
 
@@ -169,6 +181,9 @@ class ModelSet(ModelSchemaType, colander.Set):
         if not values:
             # Empty IN queries are not allowed
             return []
+        # Dedupe before compiling the IN clause - preprocess_cstruct_values may
+        # hand us a list with repeated selections
+        values = tuple(set(values))
         return ModelSetResultList(dbsession.query(model).filter(match_column.in_(values)).all())
 
     def deserialize(self, node, cstruct):
@@ -223,9 +238,10 @@ class UUIDModelSet(ModelSet):
     def preprocess_cstruct_values(self, node, cstruct):
         """Parse incoming form values to Python objects if needed.
         """
-        return [slug_to_uuid(v) for v in cstruct]
+        return [_slug_to_uuid_cached(v) for v in cstruct]
 
     def preprocess_appstruct_values(self, node: colander.SchemaNode, appstruct: set) -> t.List[str]:
         """Convert items to appstruct ids.
         """
-        return [uuid_to_slug(getattr(i, self.match_column)) for i in appstruct]
+        getter = attrgetter(self.match_column)
+        return [uuid_to_slug(getter(i)) for i in appstruct]
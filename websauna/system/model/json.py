@@ -5,9 +5,14 @@ Based on the original Kotti CMS implementation:
 * https://github.com/Kotti/Kotti/blob/5a33384e7b11994371c415b489edbec88ecbf044/kotti/sqla.py#L79
 """
 # Standard Library
-import copy
 import json
 
+try:
+    # orjson serializes to bytes in C and is several times faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
 # SQLAlchemy
 from sqlalchemy import event
 from sqlalchemy import types
@@ -26,19 +31,40 @@ def _default(obj):
         return obj._d
 
 
+def _unwrap(obj):
+    """Peel the MutationDict/MutationList wrapper off and expose the raw container.
+
+    The nested wrappers wrap their children lazily on ``__getitem__``, so the underlying container normally holds plain dicts and lists the C-level JSON encoder can traverse directly, without a ``default`` callback per node.
+    """
+    if isinstance(obj, (MutationDict, MutationList)):
+        return obj._d
+    return obj
+
+
 def json_serializer(d):
     """MutationDict friendly json_serializer for create_engine().
 
+    Uses ``orjson`` when available, as it serializes in C and is several times faster than stdlib ``json``. SQLAlchemy expects ``str`` from the serializer, so the ``orjson`` output bytes are decoded.
+
     See :py:meth:`websauna.system.model.meta.get_engine`.
 
     http://stackoverflow.com/a/36438671/315168
     """
+    d = _unwrap(d)
+    # default= is kept as a safety net for wrappers explicitly stored inside the container,
+    # e.g. by NestedMutationDict.setdefault()
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches stdlib json, which silently stringifies
+        # non-string dict keys instead of raising TypeError
+        return orjson.dumps(d, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(d, default=_default)
 
 
 class WebsaunaFriendlyMutable(Mutable):
     """A patched mutable that can deal with our generic column types."""
 
+    __slots__ = ()
+
     @classmethod
     def as_mutable(cls, orig_sqltype):
         """Mark the value as nested mutable value.
@@ -87,6 +113,10 @@ class MutationDict(WebsaunaFriendlyMutable):
     """
     _wraps = dict
 
+    #: Slot makes self._d loads a fixed-offset lookup - every wrapped dict access goes through it.
+    #: Mutable base has no __slots__, so instances still carry a __dict__ for e.g. _parents.
+    __slots__ = ('_d',)
+
     def __init__(self, data):
         self._d = data
         super(MutationDict, self).__init__()
@@ -109,6 +139,8 @@ class MutationDict(WebsaunaFriendlyMutable):
 class MutationList(WebsaunaFriendlyMutable):
     _wraps = list
 
+    __slots__ = ('_d',)
+
     def __init__(self, data):
         self._d = data
         super(MutationList, self).__init__()
@@ -131,56 +163,74 @@ class MutationList(WebsaunaFriendlyMutable):
 
 
 def _make_mutable_method_wrapper(wrapper_class, methodname, mutates):
-    def replacer(self, *args, **kwargs):
-        method = getattr(self._d, methodname)
-        value = method(*args, **kwargs)
-        if mutates:
-            self.changed()
-        return value
-
-    replacer.__name__ = methodname
-    return replacer
-
-
-for wrapper_class in (MutationDict, MutationList):
-    for methodname, mutates in (
-            ('__iter__', False),
-            ('__len__', False),
-            ('__eq__', False),
-            ('__add__', False),
-            ('__getitem__', False),
-            ('__getslice__', False),
-            ('__repr__', False),
-            ('get', False),
-            ('keys', False),
-            ('values', False),
-            ('items', False),
-
-            ('__setitem__', True),
-            ('__delitem__', True),
-            ('__setslice__', True),
-            ('__delslice__', True),
-            ('append', True),
-            ('clear', True),
-            ('extend', True),
-            ('insert', True),
-            ('pop', True),
-            ('setdefault', True),
-            ('update', True),
-            ('remove', True),
-    ):
+    # Generate the wrapper with exec() so the underlying container method is a
+    # direct bound method call on self._d and the mutates flag is baked in,
+    # instead of paying for a getattr() call and a flag check per invocation
+    if mutates:
+        src = (
+            "def {name}(self, *args, **kwargs):\n"
+            "    value = self._d.{name}(*args, **kwargs)\n"
+            "    self.changed()\n"
+            "    return value\n"
+        )
+    else:
+        src = (
+            "def {name}(self, *args, **kwargs):\n"
+            "    return self._d.{name}(*args, **kwargs)\n"
+        )
+    namespace = {}
+    exec(src.format(name=methodname), namespace)
+    return namespace[methodname]
+
+
+#: Container methods proxied to the wrapped dict/list and whether calling them mutates the container
+_WRAPPED_METHODS = (
+    ('__iter__', False),
+    ('__len__', False),
+    ('__eq__', False),
+    ('__add__', False),
+    ('__getitem__', False),
+    ('__getslice__', False),
+    ('__repr__', False),
+    ('get', False),
+    ('keys', False),
+    ('values', False),
+    ('items', False),
+
+    ('__setitem__', True),
+    ('__delitem__', True),
+    ('__setslice__', True),
+    ('__delslice__', True),
+    ('append', True),
+    ('clear', True),
+    ('extend', True),
+    ('insert', True),
+    ('pop', True),
+    ('setdefault', True),
+    ('update', True),
+    ('remove', True),
+)
+
+
+def _install_method_wrappers(wrapper_class, methods=_WRAPPED_METHODS):
+    """Install generated proxy methods on a mutation wrapper class."""
+    for methodname, mutates in methods:
         # Only wrap methods that do exist on the wrapped type!
         if getattr(wrapper_class._wraps, methodname, False):
-            setattr(
-                wrapper_class, methodname,
-                _make_mutable_method_wrapper(
-                    wrapper_class, methodname, mutates),
-            )
+            setattr(wrapper_class, methodname, _make_mutable_method_wrapper(wrapper_class, methodname, mutates))
+
+
+_install_method_wrappers(MutationDict)
+_install_method_wrappers(MutationList)
 
 
 class NestedMixin(object):
     """Base class to to nested dict and list state tracking."""
 
+    # Must stay empty: combining with the slotted MutationDict/MutationList bases
+    # would otherwise cause an instance layout conflict
+    __slots__ = ()
+
     #: Pointer to parent NestedMutatedDict or NestedMutatedList. If the parent is Column then this is None.
     __parent__ = None
 
@@ -202,13 +252,20 @@ class NestedMixin(object):
             super(NestedMixin, self).changed()
 
     def try_wrap(self, value):
-        for typ, wrapper in MUTATION_WRAPPERS.items():
-            if isinstance(value, typ):
-                value = wrapper(value, __parent__=self)
-                break
+        # Direct type checks instead of iterating MUTATION_WRAPPERS - this runs
+        # on every __getitem__ of a nested structure
+        typ = type(value)
+        if typ is dict:
+            return NestedMutationDict(value, __parent__=self)
+        if typ is list:
+            return NestedMutationList(value, __parent__=self)
         return value
 
     def __eq__(self, other):
+        if isinstance(other, NestedMixin):
+            # Compare the raw containers directly - delegating to the other
+            # wrapper would wrap accessed children through try_wrap
+            return self._d == other._d
         return self._d == other
 
     def __str__(self):
@@ -219,6 +276,9 @@ class NestedMixin(object):
 
 
 class NestedMutationDict(NestedMixin, MutationDict):
+
+    __slots__ = ()
+
     def setdefault(self, key, default):
         if isinstance(default, list):
             default = NestedMutationList(default, __parent__=self)
@@ -228,7 +288,8 @@ class NestedMutationDict(NestedMixin, MutationDict):
 
 
 class NestedMutationList(NestedMixin, MutationList):
-    pass
+
+    __slots__ = ()
 
 
 MUTATION_WRAPPERS = {
@@ -248,19 +309,29 @@ def wrap_as_nested(key: str, data: object, parent: object) -> object:
     :return: data in the nested mutable wrapper
     """
 
-    for typ, wrapper in MUTATION_WRAPPERS.items():
-        if isinstance(data, typ):
-
-            # We do a deepcopy on data here to ensure we don't run into "Mutable defaults" Python issue
-            # __parent__ = None means we dont' have parent dict or list
-            # TODO: Validate if deep copy is safe
-            data = wrapper(copy.deepcopy(data), __parent__=None)
-
-            # SQLAlchemy model instance is directly parent of this NestedMutate
-            data._parents[parent] = key
-            return data
-
-    # Unknown type :(
+    typ = type(data)
+    if typ is dict:
+        wrapper = NestedMutationDict
+    elif typ is list:
+        wrapper = NestedMutationList
+    else:
+        # Unknown type :(
+        return data
+
+    # We deep copy data here to ensure we don't run into "Mutable defaults" Python issue.
+    # A JSON round-trip is considerably faster than copy.deepcopy for JSON-shaped trees
+    # and is safe here, because these values are JSON/JSONB column defaults.
+    # Unlike deepcopy, the round-trip stringifies non-string dict keys - the same
+    # coercion the column value goes through when flushed to the database.
+    # __parent__ = None means we dont' have parent dict or list
+    if orjson is not None:
+        data = orjson.loads(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        data = json.loads(json.dumps(data))
+    data = wrapper(data, __parent__=None)
+
+    # SQLAlchemy model instance is directly parent of this NestedMutate
+    data._parents[parent] = key
     return data
 
 
@@ -269,14 +340,6 @@ def is_json_like_column(c: Column) -> bool:
     return isinstance(c.type, (JSONType, JSON, JSONB))
 
 
-def _get_column_default(target: object, column: Column):
-    if column.default is not None:
-        if callable(column.default.arg):
-            return column.default.arg(target)
-        else:
-            return column.default.arg
-
-
 def setup_default_value_handling(cls):
     """A SQLAlchemy model class decorator that ensures JSON/JSONB default values are correctly handled.
 
@@ -291,15 +354,40 @@ def setup_default_value_handling(cls):
         This must be applid to the class directly, as SQLAlchemy does not seem ot pick it up if it's applied to an (abstract) parent class.
 
     This might be addressed in future SQLAlchemy / Websauna versions so that we can get rid of this ugly little decorator.
+
+    .. note ::
+
+        A model can declare ``__json_columns__ = ('user_data', ...)`` to name its JSON columns explicitly. Then only the declared columns are considered and the per-column type scan of the table is skipped entirely.
     """
 
+    # Scan the table only once at decoration time - the init listener fires on
+    # every model instantiation and should not re-filter all columns
+    declared = getattr(cls, "__json_columns__", None)
+    if declared is not None:
+        json_columns = [cls.__table__.columns[name] for name in declared]
+    else:
+        json_columns = [c for c in cls.__table__.columns if is_json_like_column(c)]
+
+    if not json_columns:
+        return cls
+
+    # Also resolve the column defaults up front, so the listener is a direct
+    # load of a precomputed value or a single factory call per column
+    column_defaults = []
+    for c in json_columns:
+        arg = c.default.arg if c.default is not None else None
+        if callable(arg):
+            column_defaults.append((c.name, None, arg))
+        else:
+            column_defaults.append((c.name, arg, None))
+
     @event.listens_for(cls, "init")
     def init(target, args, kwargs):
-        for c in target.__table__.columns:
-            if is_json_like_column(c):
-                default = _get_column_default(target, c)
-                default = wrap_as_nested(c.name, default, target)
-                setattr(target, c.name, default)
+        for name, default, default_factory in column_defaults:
+            if default_factory is not None:
+                default = default_factory(target)
+            default = wrap_as_nested(name, default, target)
+            setattr(target, name, default)
 
     return cls
 
@@ -308,6 +396,11 @@ def init_for_json(cls):
     """Check if we need to add JSON column specific SQLAlchemy event listers for this model."""
     # import pdb ; pdb.set_trace()
     global _loaded_listener
-    has_json_columns = any([is_json_like_column(c) for c in cls.__table__.columns])
+    if getattr(cls, "__json_columns__", None) is not None:
+        # Explicitly declared JSON columns, no need to scan the table.
+        # An empty declaration means no JSON columns and no listener.
+        setup_default_value_handling(cls)
+        return
+    has_json_columns = any(is_json_like_column(c) for c in cls.__table__.columns)
     if has_json_columns:
         setup_default_value_handling(cls)
@@ -17,6 +17,8 @@ from sqlalchemy.schema import MetaData
 from websauna.system.http import Request
 from websauna.system.model.interfaces import ISQLAlchemySessionFactory
 
+from .json import MutationDict
+from .json import MutationList
 from .json import init_for_json
 from .json import json_serializer
 
@@ -91,6 +93,18 @@ def create_transaction_manager_aware_dbsession(request: Request) -> Session:
     return dbsession
 
 
+def _register_psycopg2_json_adapters():
+    """Teach psycopg2 to encode mutation-wrapped JSON values natively.
+
+    SQLAlchemy runs JSON/JSONB column values through ``json_serializer``, but MutationDict/MutationList instances can also reach the driver directly as plain bind parameters (raw SQL, comparisons). Registering adapters lets psycopg2 unwrap them to the underlying container and use its native JSON encoding, instead of failing on the unknown wrapper type.
+    """
+    from psycopg2.extensions import register_adapter
+    from psycopg2.extras import Json
+
+    register_adapter(MutationDict, lambda value: Json(value._d, dumps=json_serializer))
+    register_adapter(MutationList, lambda value: Json(value._d, dumps=json_serializer))
+
+
 def _get_psql_engine(settings: dict, prefix: str) -> Engine:
     """Create PostgreSQL engine.
 
@@ -99,6 +113,7 @@ def _get_psql_engine(settings: dict, prefix: str) -> Engine:
     :param prefix: Configuration prefixes
     :return: SQLAlchemy Engine
     """
+    _register_psycopg2_json_adapters()
     # http://stackoverflow.com/questions/14783505/encoding-error-with-sqlalchemy-and-postgresql
     engine = engine_from_config(settings, prefix, connect_args={"options": "-c timezone=utc"}, client_encoding='utf8', isolation_level='SERIALIZABLE', json_serializer=json_serializer)
     return engine
@@ -43,17 +43,20 @@ def ensure_transactionless(msg=None, transaction_manager: t.Union[TransactionMan
 
     txn = transaction_manager._txn
 
-    if txn:
-        if not msg:
-            msg = "Dangling transction open in transaction.manager. You should not start new one."
+    if not txn:
+        # Common happy path - no dangling transaction, skip any formatting work
+        return
 
-        transaction_thread = getattr(transaction.manager, "begin_thread", None)
-        logger.fatal("Transaction state management error. Trying to start TX in thread %s. TX started in thread %s", threading.current_thread(), transaction_thread)
+    if not msg:
+        msg = "Dangling transction open in transaction.manager. You should not start new one."
 
-        # Destroy the transaction, so if this was a temporary failure in long running process, we don't lock the process up for the good
-        txn.abort()
+    transaction_thread = getattr(transaction.manager, "begin_thread", None)
+    logger.fatal("Transaction state management error. Trying to start TX in thread %s. TX started in thread %s", threading.current_thread(), transaction_thread)
 
-        raise TransactionAlreadyInProcess(msg)
+    # Destroy the transaction, so if this was a temporary failure in long running process, we don't lock the process up for the good
+    txn.abort()
+
+    raise TransactionAlreadyInProcess(msg)
 
 
 def is_retryable(txn, error):
@@ -72,10 +75,13 @@ def is_retryable(txn, error):
     if txn is None:
         return False
 
-    for dm in txn._resources:
-        should_retry = getattr(dm, 'should_retry', None)
-        if (should_retry is not None) and should_retry(error):
-            return True
+    # Single short-circuiting pass: one should_retry lookup per resource,
+    # stop at the first data manager that wants a retry
+    return any(
+        should_retry(error)
+        for should_retry in (getattr(dm, 'should_retry', None) for dm in txn._resources)
+        if should_retry is not None
+    )
 
 
 def retryable(tm: t.Optional[TransactionManager] = None, get_tm: t.Optional[t.Callable] = None):
@@ -170,13 +176,35 @@ def retryable(tm: t.Optional[TransactionManager] = None, get_tm: t.Optional[t.Ca
             if retry_attempt_count is None:
                 raise NotRetryable("TransactionManager is not configured with default retry attempt count")
 
+            if retry_attempt_count == 1:
+                # Fast path: with a single allowed attempt there is nothing to retry,
+                # so skip the loop machinery and latest_exc bookkeeping
+                txn = manager.begin()
+                manager.latest_retry_count = 0
+                try:
+                    val = func(*args, **kwargs)
+                    try:
+                        txn.commit()
+                    except ValueError as ve:
+                        # Means there was a nested transaction begin
+                        raise TooDeepInTransactions("Looks like transaction.commit() failed - usually this means that the wrapped function {} begun its own transaction and ruined transaction state management".format(func)) from ve
+                    return val
+                except Exception as e:
+                    if is_retryable(txn, e):
+                        raise CannotRetryAnymore("Out of transaction retry attempts, tried 1 times") from e
+                    txn.abort()  # We could not commit
+                    raise
+
+            # Hoist the attribute lookups out of the attempt loop
+            begin = manager.begin
+
             # Run attempt loop
             latest_exc = None
             for num in range(retry_attempt_count):
                 if num >= 1:
                     logger.info("Transaction attempt #%d for function %s", num + 1, func)
 
-                txn = manager.begin()
+                txn = begin()
 
                 # Expose retry count for testing
                 manager.latest_retry_count = num
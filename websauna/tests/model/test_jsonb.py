@@ -1,11 +1,22 @@
 """JSONB field behavior checks."""
+# Standard Library
+import json
+
 # Pyramid
 import transaction
 
+# SQLAlchemy
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy.dialects.postgresql import JSONB
+
 import pytest
 
 # Websauna
 from websauna.system.model.json import NestedMutationDict
+from websauna.system.model.json import json_serializer
+from websauna.system.model.json import wrap_as_nested
+from websauna.system.model.meta import Base
 from websauna.system.user.models import User
 from websauna.tests.test_utils import create_user
 
@@ -55,3 +66,63 @@ def test_query_jsonb_data(dbsession, registry, query_param, expected_lines):
         User.user_data['phone_number'].astext == query_param
     ).all()
     assert len(users) == expected_lines
+
+
+_declared_model = None
+
+
+def get_declared_json_columns_model():
+    """A sample model that names its JSON columns explicitly with __json_columns__."""
+    global _declared_model
+    if _declared_model:
+        return _declared_model
+
+    class DeclaredJSONColumnsModel(Base):
+        """Declares user_data as a JSON column, leaves other_data undeclared."""
+
+        __tablename__ = "declared_json_columns_test_model"
+
+        __json_columns__ = ("user_data",)
+
+        id = Column(Integer, primary_key=True)
+        user_data = Column(NestedMutationDict.as_mutable(JSONB), default=dict)
+        other_data = Column(NestedMutationDict.as_mutable(JSONB), default=dict)
+
+    _declared_model = DeclaredJSONColumnsModel
+    return _declared_model
+
+
+def test_declared_json_columns_wrap_default():
+    """Only columns named in __json_columns__ get their defaults wrapped on init."""
+    model = get_declared_json_columns_model()
+    instance = model()
+
+    # The declared column got its wrapped default
+    assert isinstance(instance.user_data, NestedMutationDict)
+    assert instance.user_data == {}
+
+    # The undeclared JSON column was skipped by the default value handling
+    assert instance.other_data is None
+
+
+def test_json_serializer_non_string_keys():
+    """Non-string dict keys are stringified like stdlib json, regardless of the serializer backend."""
+    data = {1: {"nested": [1, 2]}, "plain": None}
+    assert json.loads(json_serializer(data)) == json.loads(json.dumps(data))
+
+
+def test_wrap_as_nested_non_string_keys():
+    """The deep copy of a JSON column default stringifies non-string keys on both copy paths."""
+
+    class FakeModel:
+        """Stand-in for a SQLAlchemy model instance owning the column value."""
+
+    data = {1: {"nested": "x"}}
+    wrapped = wrap_as_nested("user_data", data, FakeModel())
+
+    assert isinstance(wrapped, NestedMutationDict)
+    assert wrapped == json.loads(json.dumps(data))
+
+    # The default itself must not be shared with the wrapped copy
+    data[1]["nested"] = "y"
+    assert wrapped == {"1": {"nested": "x"}}
@@ -246,3 +246,79 @@ def test_give_up(test_instance, dbsession_factory, dbsession):
     with transaction.manager:
         w = dbsession.query(TestModel).get(1)
         assert w.balance == 12
+
+
+@pytest.fixture
+def single_attempt_dbsession_factory(test_request):
+    """Sessions allowing only one transaction attempt, exercising the @retryable fast path."""
+
+    def factory():
+        dbsession = create_dbsession(test_request.registry, manager=None)
+        # No retries allowed
+        dbsession.transaction_manager.retry_attempt_count = 1
+        return dbsession
+
+    return factory
+
+
+def test_single_attempt_success(test_instance, single_attempt_dbsession_factory):
+    """See that the single-attempt fast path commits normally."""
+
+    dbsession = single_attempt_dbsession_factory()
+    TestModel = get_test_model()
+
+    @retryable(tm=dbsession.transaction_manager)
+    def increment():
+        w = dbsession.query(TestModel).get(1)
+        w.balance += 1
+        return w.balance
+
+    assert increment() == 11
+    assert dbsession.transaction_manager.latest_retry_count == 0
+
+    # The commit came through
+    with dbsession.transaction_manager:
+        w = dbsession.query(TestModel).get(1)
+        assert w.balance == 11
+
+
+def test_single_attempt_some_other_exception(single_attempt_dbsession_factory):
+    """See that unknown exceptions are correctly reraised by the single-attempt fast path."""
+
+    dbsession = single_attempt_dbsession_factory()
+
+    @retryable(tm=dbsession.transaction_manager)
+    def do_stuff():
+        raise ValueError("Unknown exception")
+
+    with pytest.raises(ValueError):
+        do_stuff()
+
+
+def test_single_attempt_gives_up(test_instance, single_attempt_dbsession_factory, dbsession):
+    """See that a serialization conflict surfaces as CannotRetryAnymore when only one attempt is allowed."""
+
+    t1 = ConflictResolverThread(single_attempt_dbsession_factory)
+    t2 = ConflictResolverThread(single_attempt_dbsession_factory)
+
+    t1.start()
+    t2.start()
+
+    t1.join()
+    t2.join()
+
+    # One thread commits, the loser cannot retry
+    failure = t1.failure or t2.failure or None
+    assert isinstance(failure, CannotRetryAnymore)
+
+    success = sum([t1.success_count, t2.success_count])
+    errors = sum([t1.failure_count, t2.failure_count])
+
+    assert success == 1
+    assert errors == 1
+
+    # Only the winning increment came through
+    TestModel = get_test_model()
+    with transaction.manager:
+        w = dbsession.query(TestModel).get(1)
+        assert w.balance == 11